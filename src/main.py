@@ -5,215 +5,638 @@ import shutil
 import sys
 import logging
 import datetime
-from typing import Dict, List, Any
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QRunnable, QThreadPool
-from PyQt5.QtGui import QFont, QIcon, QKeySequence
+import errno
+import atexit
+import functools
+import itertools
+import operator
+from typing import List, Iterable, Iterator
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QFileDialog, QLabel,
-                             QLineEdit, QProgressBar, QPushButton, QTextEdit, QVBoxLayout,
-                             QWidget, QAction, QToolTip, QMessageBox, QHBoxLayout, QStackedWidget,
-                             QGroupBox, QSplitter, QFrame)
-from concurrent.futures import ThreadPoolExecutor
+                             QLineEdit, QProgressBar, QPushButton, QPlainTextEdit, QVBoxLayout,
+                             QWidget, QToolTip, QMessageBox, QHBoxLayout, QStackedWidget,
+                             QGroupBox, QSplitter)
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional; when it is installed, config and log serialization skip the pure-Python encoder
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # Undecodable filenames reach us as surrogate escapes, which only the stdlib encoder accepts
+            return json.dumps(obj)
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+ACTION_BATCH_SIZE = 128
+LOG_MAX_LINES = 10000
+LOG_FLUSH_INTERVAL_MS = 50
+TRANSACTION_LOG = 'TNIVO.log'
+# Entries have a fixed shape, so only the paths go through the JSON encoder for escaping
+MOVE_LOG_ENTRY = '{{"action":"move","source":{source},"destination":{destination},"timestamp":"{timestamp}","sequence":{sequence}}}'
+REMOVE_LOG_ENTRY = '{{"action":"remove","path":{path},"timestamp":"{timestamp}","sequence":{sequence}}}'
+
+DEFAULT_REGEX_PROFILES = [
+    {'name': 'Default', 'regex': r'^(?:\[Default\] )?(.*?)( - \d+.*|)\.(mkv|mp4|avi)$'},
+    {'name': 'Video files', 'regex': r'^(.*?) - \d{2}\.mkv$'},
+    {'name': 'Text files', 'regex': r'^(.*)\.(txt|doc|docx|odt|pdf)$'},
+    {'name': 'Image files', 'regex': r'^(.*)\.(jpg|jpeg|png|gif|bmp|svg|tiff)$'}
+]
+
+@functools.lru_cache(maxsize=64)
+def compile_regex(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+# Patterns shaped like ^(.*)\.(ext|ext|...)$ or ^(.*)\.(?:ext|...)$ only split off the last extension, which needs no regex engine
+EXTENSION_ONLY_PATTERN = re.compile(r'\^\(\.\*\)\\\.\((?:\?:)?([A-Za-z0-9]+(?:\|[A-Za-z0-9]+)*)\)\$')
+
+# ^(.*)\..*$ and ^(.*)\.(.*)$ accept any extension, so every name with a dot matches
+ANY_EXTENSION_PATTERNS = frozenset({r'^(.*)\..*$', r'^(.*)\.(.*)$'})
+
+class AnyExtension:
+    def __contains__(self, extension: str) -> bool:
+        return True
+
+@functools.lru_cache(maxsize=64)
+def extension_set(pattern: str):
+    if pattern in ANY_EXTENSION_PATTERNS:
+        return AnyExtension()
+    match = EXTENSION_ONLY_PATTERN.fullmatch(pattern)
+    return frozenset(match.group(1).split('|')) if match else None
+
+def has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 1
+        elif char == '[':
+            # A ']' right after '[' or '[^' is a literal, not the end of the class
+            i += 1
+            if pattern[i:i + 1] == '^':
+                i += 1
+            if pattern[i:i + 1] == ']':
+                i += 1
+            while i < len(pattern) and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        i += 1
+    return False
+
+# Patterns ending in \.(ext|ext|...)$ can only match names ending in one of those extensions
+SUFFIX_LIST_PATTERN = re.compile(r'(?<!\\)\\\.\((?:\?:)?([A-Za-z0-9]+(?:\|[A-Za-z0-9]+)*)\)\$\Z')
+
+@functools.lru_cache(maxsize=64)
+def required_suffixes(pattern: str):
+    # Inline flags such as (?i) and lookarounds could change what the ending accepts, so leave those to the regex
+    if '(?' in pattern.replace('(?:', '') or has_top_level_alternation(pattern):
+        return None
+    match = SUFFIX_LIST_PATTERN.search(pattern)
+    return tuple('.' + extension for extension in match.group(1).split('|')) if match else None
+
+# Built-in profiles are compiled once at import, keyed by pattern text as it arrives from the regex entry
+DEFAULT_REGEX_PATTERNS = {profile['regex']: compile_regex(profile['regex']) for profile in DEFAULT_REGEX_PROFILES}
+
+# One long-lived pool for directory listings and backup copies, rather than a fresh pool per call
+IO_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix='tnivo-io')
+atexit.register(IO_POOL.shutdown, wait=False)
+
+def list_directory(path: str) -> tuple:
+    try:
+        with os.scandir(path) as entries:
+            return path, list(entries)
+    except OSError:
+        return path, []
+
+def scan_tree(directory: str, include_hidden: bool = True):
+    # Every directory is listed on a worker thread; scandir releases the GIL, so the syscall latency overlaps
+    pending = {IO_POOL.submit(list_directory, directory)}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            path, entries = future.result()
+            for entry in entries:
+                if entry.is_dir():
+                    # Dot folders (.git, .cache, ...) can hold more entries than everything else combined
+                    if not include_hidden and entry.name.startswith('.'):
+                        continue
+                    if not entry.is_symlink():
+                        pending.add(IO_POOL.submit(list_directory, entry.path))
+                yield path, entry
+
+def scan_files(directory: str, recursive: bool = True, include_hidden: bool = True):
+    # Like os.walk, but reuses the DirEntry type info instead of stat'ing every entry
+    if recursive:
+        for _, entry in scan_tree(directory, include_hidden):
+            if not entry.is_dir():
+                yield entry
+        return
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    yield entry
+    except OSError:
+        return
+
+FICLONE = 0x40049409
+
+def clone_or_copy(source: str, destination: str):
+    # On reflink-capable filesystems (Btrfs, XFS) the backup shares data blocks instead of copying them
+    if fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copymode(source, destination)
+            return
+        except OSError:
+            pass
+    shutil.copy(source, destination)
+
+FILE_MAPPINGS = {
+    'Images': ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'tiff', 'tif', 'ico', 'webp', 'raw', 'cr2', 'nef', 'arw', 'dng', 'heic', 'psd', 'ai', 'eps'],
+    'Videos': ['mp4', 'mkv', 'flv', 'avi', 'mov', 'wmv', 'mpg', 'mpeg', 'm4v', 'h264', 'webm', '3gp', 'ogv', 'vob', 'ts', 'm2ts', 'mts'],
+    'Documents': ['doc', 'docx', 'pdf', 'txt', 'rtf', 'odt', 'xls', 'xlsx', 'ods', 'ppt', 'pptx', 'odp', 'csv', 'tsv', 'md', 'tex', 'log', 'json', 'xml', 'yml', 'yaml'],
+    'Audio': ['mp3', 'wav', 'aac', 'flac', 'ogg', 'wma', 'm4a', 'aiff', 'alac', 'ape', 'opus', 'mid', 'midi'],
+    'Archives': ['zip', 'rar', '7z', 'gz', 'tar', 'bz2', 'xz', 'tar.gz', 'tgz', 'tar.bz2', 'tar.xz', 'iso'],
+    'Code': ['py', 'js', 'html', 'css', 'java', 'cpp', 'c', 'h', 'hpp', 'cs', 'sh', 'bat', 'ps1', 'php', 'sql', 'rb', 'swift', 'go', 'rs', 'ts', 'jsx', 'vue', 'kt', 'scala', 'pl', 'lua', 'r'],
+    'eBooks': ['epub', 'mobi', 'azw', 'azw3', 'prc', 'pdf', 'djvu', 'fb2', 'lit', 'lrf'],
+    'Executables': ['exe', 'msi', 'app', 'dmg', 'deb', 'rpm', 'apk', 'ipa'],
+    'Fonts': ['ttf', 'otf', 'woff', 'woff2', 'eot'],
+    'Databases': ['db', 'sqlite', 'sqlite3', 'mdb', 'accdb'],
+    '3D_Models': ['obj', 'fbx', 'stl', 'blend', 'dae', '3ds', 'max'],
+    'CAD': ['dwg', 'dxf', 'step', 'stp', 'iges', 'igs'],
+    'Spreadsheets': ['xls', 'xlsx', 'ods', 'csv', 'tsv'],
+    'Presentations': ['ppt', 'pptx', 'odp', 'key'],
+    'Vector_Graphics': ['svg', 'ai', 'eps', 'cdr'],
+    'Disk_Images': ['iso', 'img', 'vhd', 'vmdk'],
+    'Config_Files': ['ini', 'cfg', 'conf', 'config'],
+    'Backup_Files': ['bak', 'old', 'backup'],
+    'Others': []
+}
+
+# Extension -> folder, built once; the first category listing an extension wins, as the ordered scan did
+EXTENSION_FOLDERS = {}
+for folder, extensions in FILE_MAPPINGS.items():
+    for extension in extensions:
+        EXTENSION_FOLDERS.setdefault(extension, folder)
+
+THEMES = {
+    'Dark': """
+        QWidget {
+            background-color: #333;
+            color: #EEE;
+        }
+        QPushButton, QCheckBox, QComboBox, QLineEdit, QProgressBar, QPlainTextEdit {
+            border: 1px solid #555;
+            padding: 5px;
+            margin: 5px;
+            border-radius: 5px;
+        }
+        QPushButton {
+            background-color: #555;
+            color: #EEE;
+        }
+        QPushButton:hover {
+            background-color: #777;
+        }
+        QProgressBar {
+            border: 2px solid #555;
+            border-radius: 5px;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background-color: #777;
+            width: 20px;
+        }
+        QPlainTextEdit {
+            background-color: #222;
+            color: #EEE;
+        }
+    """,
+    'Green': """
+        QWidget {
+            background-color: #E8F5E9;
+            color: #256029;
+        }
+        QPushButton, QCheckBox, QComboBox, QLineEdit, QProgressBar, QPlainTextEdit {
+            border: 1px solid #A5D6A7;
+            padding: 5px;
+            margin: 5px;
+            border-radius: 5px;
+        }
+        QPushButton {
+            background-color: #A5D6A7;
+            color: #256029;
+        }
+        QPushButton:hover {
+            background-color: #81C784;
+        }
+        QProgressBar {
+            border: 2px solid #A5D6A7;
+            border-radius: 5px;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background-color: #81C784;
+            width: 20px;
+        }
+        QPlainTextEdit {
+            background-color: #C8E6C9;
+            color: #256029;
+        }
+    """,
+    'Light': """
+        QWidget {
+            background-color: #FFF;
+            color: #000;
+        }
+        QPushButton, QCheckBox, QComboBox, QLineEdit, QProgressBar, QPlainTextEdit {
+            border: 1px solid #CCC;
+            padding: 5px;
+            margin: 5px;
+            border-radius: 5px;
+        }
+        QPushButton {
+            background-color: #EEE;
+            color: #000;
+        }
+        QPushButton:hover {
+            background-color: #DDD;
+        }
+        QProgressBar {
+            border: 2px solid #CCC;
+            border-radius: 5px;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background-color: #DDD;
+            width: 20px;
+        }
+        QPlainTextEdit {
+            background-color: #EEE;
+            color: #000;
+        }
+    """,
+}
 
 # Set up logging
 logging.basicConfig(filename='tnivo.log', level=logging.INFO, format='%(asctime)s %(message)s')
 
+def get_file_logger(name: str, filename: str, level: int, fmt: str = '%(asctime)s - %(message)s') -> logging.Logger:
+    # Loggers are process-wide, so attach the handler only the first time instead of once per instance
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.setLevel(level)
+        handler = logging.FileHandler(filename, delay=True)
+        handler.setFormatter(logging.Formatter(fmt))
+        logger.addHandler(handler)
+        logger.propagate = False
+    return logger
+
+# One handler for the error log, shared by every organizer and the window; the file opens on first record
+ERROR_LOGGER = get_file_logger('TNIVOErrors', 'TNIVO_error.log', logging.ERROR)
+# organizer.log keeps its bare one-message-per-line format, written through a handle held open for the session
+ORGANIZER_LOGGER = get_file_logger('TNIVOOrganizer', 'organizer.log', logging.INFO, '%(message)s')
+
 class FileOrganizer(QThread):
     progress_signal = pyqtSignal(int)
     log_signal = pyqtSignal(str)
     
-    def __init__(self, directory: str, regex_pattern: str, dry_run: bool, reverse: bool = False, organize_inside_folders: bool = False, enable_backup: bool = False):
+    def __init__(self, directory: str, regex_pattern: str, dry_run: bool, reverse: bool = False, organize_inside_folders: bool = False, enable_backup: bool = False, mode: str = 'regex', include_hidden: bool = False):
         super().__init__()
         self.directory = directory
+        self.mode = mode
         self.regex_pattern = regex_pattern
         self.dry_run = dry_run
         self.reverse = reverse
         self.organize_inside_folders = organize_inside_folders
         self.enable_backup = enable_backup
-        self.action_logger = logging.getLogger('FileOrganizerActions')
-        self.action_logger.setLevel(logging.INFO)
-        action_handler = logging.FileHandler('TNIVO.log')
-        action_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-        self.action_logger.addHandler(action_handler)
-        self.error_logger = logging.getLogger('FileOrganizerErrors')
-        self.error_logger.setLevel(logging.ERROR)
-        error_handler = logging.FileHandler('TNIVO_error.log')
-        error_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-        self.error_logger.addHandler(error_handler)
+        self.include_hidden = include_hidden
+        self.error_logger = ERROR_LOGGER
         self.action_counter = 0
+        self.created_dirs = set()
+        self.transaction_log = None
+        self.stopped = False
+        self.action_handlers = {'move': self.execute_move, 'remove': self.execute_remove}
+
+    def stop(self):
+        # Checked between actions, so an in-flight move always completes and the log gets closed
+        self.stopped = True
 
     def run(self):
-        actions = self.prepare_actions() if not self.reverse else self.prepare_reverse_actions()
-        if self.reverse:
-            self.execute_actions(actions)
-        if self.enable_backup:
-            self.create_backup(actions)
-        if not self.reverse:
-            self.execute_actions(actions)
+        # A dry run touches nothing, so it neither copies backups nor records actions that never happened
+        backup = self.enable_backup and not self.dry_run
+        # One JSON line per action, appended through a single buffered handle for the whole run
+        if not self.dry_run:
+            self.transaction_log = open(TRANSACTION_LOG, 'a', buffering=1 << 16, encoding='utf-8')
+        try:
+            if self.reverse:
+                actions = self.prepare_reverse_actions()
+                # The backup is taken while every source is still in place, as in regex and filetype mode
+                if backup:
+                    actions = list(actions)
+                    self.create_backup(actions)
+                self.execute_actions(actions)
+            else:
+                actions = self.prepare_filetype_actions() if self.mode == 'filetype' else self.prepare_actions()
+                # Backups need every action up front, and a nested scan must not see files we are moving
+                if backup or (self.organize_inside_folders and not self.dry_run):
+                    actions = list(actions)
+                if backup:
+                    self.create_backup(actions)
+                self.execute_actions(actions)
+        finally:
+            if self.transaction_log is not None:
+                # Batches only hit the buffer; the log reaches the disk once, when the run is over
+                self.transaction_log.flush()
+                try:
+                    os.fsync(self.transaction_log.fileno())
+                except OSError:
+                    pass
+                self.transaction_log.close()
+                self.transaction_log = None
 
     def create_backup(self, actions: List[tuple]):
         backup_dir = os.path.join(self.directory, 'backup')
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
-        with ThreadPoolExecutor() as executor:
-            for action in actions:
-                if action[0] == 'move':
-                    source = action[1]
-                    destination = os.path.join(backup_dir, os.path.basename(source))
-                    executor.submit(shutil.copy, source, destination)
-                    self.log_signal.emit(f'Backup created for {source}')
-
-    def prepare_actions(self) -> List[tuple]:
-        actions = []
+        os.makedirs(backup_dir, exist_ok=True)
+        # Every source was found by scanning below the organized directory, so its relative path is a plain slice
+        base_length = len(os.path.join(self.directory, ''))
+        sources = [(action[1], action[1][base_length:]) for action in actions if action[0] == 'move']
+        # Subfolders are mirrored below the backup folder; each one is created once, before any copy starts
+        relative_dirs = {relative.rpartition(os.sep)[0] for _, relative in sources} - {''}
+        for relative_dir in relative_dirs:
+            os.makedirs(os.path.join(backup_dir, relative_dir), exist_ok=True)
+        # Copies go to the pool a batch at a time, and each batch reports back with a single log signal
+        futures = [IO_POOL.submit(self.backup_batch, sources[i:i + ACTION_BATCH_SIZE], backup_dir)
+                   for i in range(0, len(sources), ACTION_BATCH_SIZE)]
+        for future in futures:
+            if self.stopped:
+                # Batches not started yet are dropped; running ones stop at their next file and are waited for
+                for pending in futures:
+                    pending.cancel()
+                wait(futures)
+                return
+            self.log_signal.emit('\n'.join(future.result()))
+
+    def backup_batch(self, sources: List[tuple], backup_dir: str) -> List[str]:
+        log_messages = []
+        for source, relative in sources:
+            if self.stopped:
+                break
+            try:
+                # Keep the layout below the organized directory so same-named files in subfolders don't collide
+                destination = os.path.join(backup_dir, relative)
+                clone_or_copy(source, destination)
+                log_messages.append(f'Backup created for {source}')
+            except OSError as e:
+                error_message = f'Error creating backup for {source}: {e}'
+                self.error_logger.error(error_message)
+                log_messages.append(error_message)
+        return log_messages
+
+    def prepare_actions(self) -> Iterator[tuple]:
         if not self.regex_pattern:
             self.log_signal.emit("Error: Regex pattern cannot be empty.")
-            return actions
+            return
 
         try:
-            regex = re.compile(self.regex_pattern)
+            regex = DEFAULT_REGEX_PATTERNS.get(self.regex_pattern) or compile_regex(self.regex_pattern)
         except re.error as e:
             self.log_signal.emit(f"Error compiling regex: {e}")
-            return actions
-
-        for root, dirs, files in os.walk(self.directory):
-            if root == self.directory or self.organize_inside_folders:
-                for name in files:
-                    match = regex.search(name)
-                    if match and len(match.groups()) > 0:
-                        filename = match.group(1)
-                        source = os.path.join(root, name)
-                        destination_dir = os.path.join(self.directory, filename)
-                        destination = os.path.join(destination_dir, name)
-                        actions.append(('move', source, destination))
-        return actions
-
-    def prepare_reverse_actions(self) -> List[tuple]:
-        actions = []
-        # First, move all files back to the main directory
-        for root, dirs, files in os.walk(self.directory):
-            if root != self.directory:
-                for name in files:
-                    source = os.path.join(root, name)
-                    destination = os.path.join(self.directory, name)
-                    actions.append(('move', source, destination))
-        
-        # Then, collect all subdirectories for removal
-        for root, dirs, files in os.walk(self.directory, topdown=False):
-            if root != self.directory:
-                actions.append(('remove', root))
-        
-        if self.enable_backup:
-            backup_dir = os.path.join(self.directory, 'backup')
-            if os.path.exists(backup_dir):
-                actions.append(('remove', backup_dir))
-        
-        return actions
-
-    def execute_actions(self, actions: List[tuple]):
-        total_actions = len(actions)
+            return
+
+        if regex.groups == 0:
+            self.log_signal.emit("Error: Regex pattern needs a capture group to name the target folder.")
+            return
+
+        # A pattern anchored with ^ and free of top-level alternation can only match at the start, so skip the search scan
+        anchored = self.regex_pattern.startswith('^') and not has_top_level_alternation(self.regex_pattern)
+        match_name = regex.match if anchored else regex.search
+        extensions = extension_set(self.regex_pattern)
+        suffixes = required_suffixes(self.regex_pattern)
+        base_prefix = os.path.join(self.directory, '')
+        for entry in scan_files(self.directory, recursive=self.organize_inside_folders, include_hidden=self.include_hidden):
+            if self.stopped:
+                return
+            name = entry.name
+            # '.' never matches a newline, so such names keep going through the regex
+            if extensions is not None and '\n' not in name:
+                filename, dot, extension = name.rpartition('.')
+                if not dot or extension not in extensions:
+                    continue
+            else:
+                # A plain endswith turns away most names before the regex runs, e.g. non-videos for the Default profile
+                if suffixes is not None and '\n' not in name and not name.endswith(suffixes):
+                    continue
+                match = match_name(name)
+                if match is None:
+                    continue
+                filename = match[1]
+                if filename is None:
+                    continue
+            destination_dir = base_prefix + filename
+            yield ('move', entry.path, destination_dir + os.sep + name, destination_dir)
+
+    def prepare_filetype_actions(self) -> Iterator[tuple]:
+        base_prefix = os.path.join(self.directory, '')
+        for entry in scan_files(self.directory, recursive=self.organize_inside_folders, include_hidden=self.include_hidden):
+            if self.stopped:
+                return
+            name = entry.name
+            folder = EXTENSION_FOLDERS.get(name.rpartition('.')[2].lower(), 'Others')
+            destination_dir = base_prefix + folder
+            yield ('move', entry.path, destination_dir + os.sep + name, destination_dir)
+
+    def prepare_reverse_actions(self) -> Iterator[tuple]:
+        directories = []
+        base_prefix = os.path.join(self.directory, '')
+        # Move every nested file back to the main directory, noting each subdirectory on the way
+        for path, entry in scan_tree(self.directory, self.include_hidden):
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    directories.append(entry.path)
+            elif path != self.directory:
+                yield ('move', entry.path, base_prefix + entry.name, self.directory)
+
+        # Parents are always found before their children, so reversed order removes bottom-up
+        for directory in reversed(directories):
+            yield ('remove', directory)
+
+    def execute_actions(self, actions: Iterable[tuple]):
+        # Streamed actions have no length up front, so progress stays indeterminate until the scan ends
+        total_actions = len(actions) if isinstance(actions, list) else None
+        if total_actions is None:
+            self.progress_signal.emit(-1)
         completed_actions = 0
+        submitted_actions = 0
+        self.last_progress = None
         self.action_counter += 1
         action_sequence = self.action_counter
-        with ThreadPoolExecutor() as executor:
-            for action in actions:
+        removals = []
+        actions = iter(actions)
+        # Every move stays inside the chosen directory, so it is normally a single rename syscall;
+        # running the batches inline is cheaper than handing them to a thread pool
+        while not self.stopped:
+            batch = list(itertools.islice(actions, ACTION_BATCH_SIZE))
+            if not batch:
+                break
+            submitted_actions += len(batch)
+            moves = []
+            for action in batch:
+                (moves if action[0] == 'move' else removals).append(action)
+            # Grouping a batch by destination folder keeps consecutive renames in the same directory;
+            # a full sort would need the whole scan first, which streaming avoids
+            moves.sort(key=operator.itemgetter(3))
+            if not self.dry_run:
+                self.create_destination_dirs(moves)
+            completed_actions += self.execute_batch(moves, action_sequence)
+            if total_actions is not None:
+                self.report_progress(completed_actions, total_actions)
+        total_actions = submitted_actions
+        self.report_progress(completed_actions, total_actions)
+        # Removals run in order after every move, so nested directories go bottom-up
+        for i in range(0, len(removals), ACTION_BATCH_SIZE):
+            if self.stopped:
+                break
+            completed_actions += self.execute_batch(removals[i:i + ACTION_BATCH_SIZE], action_sequence)
+            self.report_progress(completed_actions, total_actions)
+
+    def create_destination_dirs(self, moves: List[tuple]):
+        # One makedirs per new folder, done before the batch runs; move actions carry their folder already
+        new_dirs = {action[3] for action in moves} - self.created_dirs
+        for destination_dir in new_dirs:
+            try:
+                # Destination folders sit directly under the organized directory, so one mkdir is the usual case
+                os.mkdir(destination_dir)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
                 try:
-                    action_type, *params = action
-
-                    if action_type == 'move':
-                        source, destination = params
-                        if not self.dry_run:
-                            os.makedirs(os.path.dirname(destination), exist_ok=True)
-                            executor.submit(shutil.move, source, destination)
-                        log_message = f'Moved file: {source} to {destination}'
-                        self.log_signal.emit(log_message)
-                        log_entry = json.dumps({'action': 'move', 'source': source, 'destination': destination, 'timestamp': str(datetime.datetime.now()), 'sequence': action_sequence})
-                        self.action_logger.info(log_entry)
-                    elif action_type == 'remove':
-                        path = params[0]
-                        if not self.dry_run:
-                            if os.path.isdir(path):
-                                executor.submit(shutil.rmtree, path)
-                            else:
-                                executor.submit(os.remove, path)
-                        log_message = f'Removed: {path}'
-                        self.log_signal.emit(log_message)
-                        log_entry = json.dumps({'action': 'remove', 'path': path, 'timestamp': str(datetime.datetime.now()), 'sequence': action_sequence})
-                        self.action_logger.info(log_entry)
-                except Exception as e:
-                    error_message = f'Error executing action {action}: {e}'
-                    self.log_signal.emit(error_message)
-                    self.error_logger.error(error_message, exc_info=True)
-                finally:
-                    completed_actions += 1
-                    progress_percentage = int((completed_actions / float(total_actions)) * 100)
-                    self.progress_signal.emit(progress_percentage)
-
-class OrganizeByFiletypeTask(QRunnable):
-    def __init__(self, organizer, directory, file_mappings):
-        super().__init__()
-        self.organizer = organizer
-        self.directory = directory
-        self.file_mappings = file_mappings
-        self.backup_dir = os.path.join(directory, 'backup') if self.organizer.filetype_backup_option_check.isChecked() else None
+                    os.makedirs(destination_dir, exist_ok=True)
+                except OSError as e:
+                    self.error_logger.error(f'Error creating directory {destination_dir}: {e}')
+            except OSError as e:
+                self.error_logger.error(f'Error creating directory {destination_dir}: {e}')
+        self.created_dirs |= new_dirs
 
-    def run(self):
+    def report_progress(self, completed_actions: int, total_actions: int):
+        progress_percentage = int((completed_actions / float(total_actions)) * 100) if total_actions else 100
+        # At most one signal per percent, however many files there are
+        if progress_percentage != self.last_progress:
+            self.last_progress = progress_percentage
+            self.progress_signal.emit(progress_percentage)
+
+    def execute_batch(self, batch: List[tuple], action_sequence: int) -> int:
+        log_messages = []
+        log_entries = []
+        # Bound once here rather than looked up again for every file in the batch
+        now = datetime.datetime.now
+        dry_run = self.dry_run
+        execute_action = self.execute_action
+        add_message = log_messages.append
+        add_entry = log_entries.append
+        for action in batch:
+            if self.stopped:
+                break
+            # Stamped per action: a move that falls back to copy and delete can take a while.
+            # Dry runs write no entries, so they skip the clock
+            timestamp = None if dry_run else now().isoformat(' ', 'seconds')
+            log_message, log_entry = execute_action(action, action_sequence, timestamp)
+            add_message(log_message)
+            if log_entry:
+                add_entry(log_entry)
+        if log_entries and self.transaction_log is not None:
+            self.transaction_log.write('\n'.join(log_entries) + '\n')
+        if log_messages:
+            self.log_signal.emit('\n'.join(log_messages))
+        return len(log_messages)
+
+    def execute_action(self, action: tuple, action_sequence: int, timestamp: str) -> tuple:
+        handler = self.action_handlers.get(action[0])
+        if handler is None:
+            return f'Skipped unknown action: {action}', None
         try:
-            total_files = sum([len(files) for _, _, files in os.walk(self.directory)])
-            processed_files = 0
-            for root, dirs, files in os.walk(self.directory):
-                if root == self.directory or self.organizer.organize_inside_folders_check.isChecked():
-                    for file in files:
-                        ext = file.split('.')[-1].lower()
-                        found = False
-                        for folder, extensions in self.file_mappings.items():
-                            if ext in extensions:
-                                destination_folder = os.path.join(self.directory, folder)
-                                if not os.path.exists(destination_folder):
-                                    os.makedirs(destination_folder)
-                                source_path = os.path.join(root, file)
-                                self.organizer.move_file(source_path, destination_folder, file, self.backup_dir)
-                                found = True
-                                break
-                        if not found:
-                            destination_folder = os.path.join(self.directory, 'Others')
-                            if not os.path.exists(destination_folder):
-                                os.makedirs(destination_folder)
-                            source_path = os.path.join(root, file)
-                            self.organizer.move_file(source_path, destination_folder, file, self.backup_dir)
-                        processed_files += 1
-                        progress = int((processed_files / total_files) * 100)
-                        self.organizer.progress_signal.emit(progress)
+            return handler(action, action_sequence, timestamp)
         except Exception as e:
-            self.organizer.log_signal.emit(f'Error organizing by filetype: {e}')
+            error_message = f'Error executing action {action}: {e}'
+            self.error_logger.error(error_message, exc_info=True)
+            return error_message, None
 
-class TNIVOrganizer(QWidget):
-    log_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int)
+    def execute_move(self, action: tuple, action_sequence: int, timestamp: str) -> tuple:
+        _, source, destination, _ = action
+        if self.dry_run:
+            return f'Moved file: {source} to {destination}', None
+        # Built before the move, so a completed move can never be reported as failed by its log entry
+        log_entry = MOVE_LOG_ENTRY.format(source=json_dumps(source), destination=json_dumps(destination),
+                                          timestamp=timestamp, sequence=action_sequence)
+        try:
+            # Replaces an existing file on every platform, so only cross-device moves and directory targets need shutil
+            os.replace(source, destination)
+        except OSError:
+            shutil.move(source, destination)
+        return f'Moved file: {source} to {destination}', log_entry
+
+    def execute_remove(self, action: tuple, action_sequence: int, timestamp: str) -> tuple:
+        path = action[1]
+        if self.dry_run:
+            return f'Removed: {path}', None
+        log_entry = REMOVE_LOG_ENTRY.format(path=json_dumps(path), timestamp=timestamp, sequence=action_sequence)
+        # Directories arrive deepest first, so a plain rmdir is enough once their files are moved out
+        try:
+            os.rmdir(path)
+        except OSError as e:
+            if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                raise
+            # Something was left behind, e.g. a move that failed; keep it instead of deleting files
+            return f'Kept non-empty directory: {path}', None
+        return f'Removed: {path}', log_entry
 
+class TNIVOrganizer(QWidget):
     def __init__(self):
         super().__init__()
-        self.logger = logging.getLogger('TNIVOrganizer')
-        self.logger.setLevel(logging.INFO)
-        handler = logging.FileHandler('TNIVO.log')
-        handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-        self.logger.addHandler(handler)
-        self.error_logger = logging.getLogger('TNIVOrganizerErrors')
-        self.error_logger.setLevel(logging.ERROR)
-        error_handler = logging.FileHandler('TNIVO_error.log')
-        error_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-        self.error_logger.addHandler(error_handler)
+        self.error_logger = ERROR_LOGGER
         icon_path = self.resource_path(os.path.join('assets', 'TNIVO.png'))
         self.setWindowIcon(QIcon(icon_path))
         self.organizer = FileOrganizer(directory="", regex_pattern="", dry_run=False)
         self.config_file = 'config.json'
-        self.load_config()
+        self.applied_theme = None
         self.init_ui()
+        self.save_config_timer = QTimer(self)
+        self.save_config_timer.setSingleShot(True)
+        self.save_config_timer.setInterval(500)
+        self.save_config_timer.timeout.connect(self.save_config)
+        # Reading the config waits for the event loop so the window can be shown first
+        QTimer.singleShot(0, self.finish_init)
+
+    def finish_init(self):
+        self.load_config()
         self.update_ui_from_config()
         self.apply_theme_from_config()
         self.apply_theme()
         self.update_regex_from_config()
-        self.threadpool = QThreadPool()
 
-    def resource_path(self, relative_path: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def resource_path(relative_path: str) -> str:
         try:
             base_path = sys._MEIPASS
         except Exception:
@@ -234,20 +657,22 @@ class TNIVOrganizer(QWidget):
             self.regex_combo.setCurrentIndex(index)
 
     def load_config(self):
-        if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
-        else:
+        try:
+            with open(self.config_file, 'rb') as f:
+                self.config = json_loads(f.read())
+        except FileNotFoundError:
             self.config = {
                 'theme': 'Dark',
                 'last_used_directory': '',
-                'regex_profiles': [
-                    {'name': 'Default', 'regex': r'^(?:\[Default\] )?(.*?)( - \d+.*|)\.(mkv|mp4|avi)$'},
-                    {'name': 'Video files', 'regex': r'^(.*?) - \d{2}\.mkv$'},
-                    {'name': 'Text files', 'regex': r'^(.*)\.(txt|doc|docx|odt|pdf)$'},
-                    {'name': 'Image files', 'regex': r'^(.*)\.(jpg|jpeg|png|gif|bmp|svg|tiff)$'}
-                ]
+                'regex_profiles': [dict(profile) for profile in DEFAULT_REGEX_PROFILES]
             }
+        self.profile_names = {profile['name'] for profile in self.config['regex_profiles']}
+        # Saved profiles are compiled here, so the first organize with one of them finds it in compile_regex's cache
+        for profile in self.config['regex_profiles']:
+            try:
+                compile_regex(profile['regex'])
+            except re.error:
+                pass
 
     def update_regex_entry(self, index: int):
         if index == -1:
@@ -273,9 +698,18 @@ class TNIVOrganizer(QWidget):
             self.regex_combo.setCurrentIndex(index)
         self.update_regex_entry(0)
 
+    def closeEvent(self, event):
+        if self.organizer is not None and self.organizer.isRunning():
+            self.organizer.stop()
+            self.organizer.wait()
+        if self.save_config_timer.isActive():
+            self.save_config_timer.stop()
+            self.save_config()
+        super().closeEvent(event)
+
     def save_config(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f)
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            f.write(json_dumps(self.config))
 
     def save_profile(self):
         profile_name = self.profile_name_entry.text()
@@ -284,15 +718,15 @@ class TNIVOrganizer(QWidget):
             QMessageBox.warning(self, "Empty Profile Name", "Please write a profile name before saving.")
             return
 
-        for profile in self.config['regex_profiles']:
-            if profile['name'] == profile_name:
-                QMessageBox.critical(self, "Error", "Profile name already exists.")
-                return
+        if profile_name in self.profile_names:
+            QMessageBox.critical(self, "Error", "Profile name already exists.")
+            return
 
         self.config['regex_profiles'].append({
             'name': profile_name,
             'regex': regex
         })
+        self.profile_names.add(profile_name)
         self.save_config()
         self.regex_combo.addItem(profile_name)
 
@@ -302,6 +736,7 @@ class TNIVOrganizer(QWidget):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             self.config['regex_profiles'] = [profile for profile in self.config['regex_profiles'] if profile['name'] != profile_name]
+            self.profile_names.discard(profile_name)
             self.save_config()
             index = self.regex_combo.findText(profile_name)
             if index != -1:
@@ -356,8 +791,16 @@ class TNIVOrganizer(QWidget):
         log_group = QGroupBox("Log")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # The oldest lines drop off once the limit is hit, so long runs don't make every append slower
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
+        self.pending_log = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+        self.clear_log_confirm = None
         log_layout.addWidget(self.log_text)
         
         log_buttons = QHBoxLayout()
@@ -436,9 +879,11 @@ class TNIVOrganizer(QWidget):
         self.reverse_check = QCheckBox('Reverse')
         self.organize_inside_folders_check = QCheckBox('Organize inside folders')
         self.backup_option_check = QCheckBox('Enable Backup')
+        self.include_hidden_check = QCheckBox('Include hidden folders')
         options_layout.addWidget(self.dry_run_check)
         options_layout.addWidget(self.reverse_check)
         options_layout.addWidget(self.organize_inside_folders_check)
+        options_layout.addWidget(self.include_hidden_check)
         options_layout.addWidget(self.backup_option_check)
         options_group.setLayout(options_layout)
         layout.addWidget(options_group)
@@ -469,7 +914,9 @@ class TNIVOrganizer(QWidget):
         options_group = QGroupBox("Options")
         options_layout = QVBoxLayout()
         self.filetype_backup_option_check = QCheckBox('Enable Backup')
+        self.filetype_include_hidden_check = QCheckBox('Include hidden folders')
         options_layout.addWidget(self.filetype_backup_option_check)
+        options_layout.addWidget(self.filetype_include_hidden_check)
         options_group.setLayout(options_layout)
         layout.addWidget(options_group)
         
@@ -487,29 +934,21 @@ class TNIVOrganizer(QWidget):
     def update_regex(self):
         self.regex_entry.setText('')
         if self.regex_combo.currentText() == 'Default':
-            self.regex_entry.setText(r'^(?:\[Default\] )?(.*?)( - \d+.*|)\.(mkv|mp4|avi)$')
+            self.regex_entry.setText(DEFAULT_REGEX_PROFILES[0]['regex'])
         else:
             self.regex_entry.setText('')
 
-    def change_theme(self):
-        current_theme = self.theme_combo.currentText()
-        self.config['theme'] = current_theme
-        self.save_config()
-        self.apply_theme()
-
     def apply_theme(self):
         current_theme = self.theme_combo.currentText()
-        self.config['theme'] = current_theme
-        self.save_config()
-
-        if current_theme == 'Dark':
-            self.setStyleSheet(self.dark_theme())
-        elif current_theme == 'Green':
-            self.setStyleSheet(self.green_theme())
-        elif current_theme == 'Light':
-            self.setStyleSheet(self.white_theme())
-        else:
-            self.setStyleSheet("")
+        # Applying the theme loaded from config.json is not a change, so startup never rewrites the file
+        if self.config.get('theme') != current_theme:
+            self.config['theme'] = current_theme
+            # Rapid theme switches collapse into one config write
+            self.save_config_timer.start()
+        # Startup and combo changes can ask for the same theme several times; Qt only re-parses the stylesheet on a real change
+        if current_theme != self.applied_theme:
+            self.applied_theme = current_theme
+            self.setStyleSheet(THEMES.get(current_theme, ''))
 
     def browse(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Directory")
@@ -519,7 +958,7 @@ class TNIVOrganizer(QWidget):
             else:
                 self.filetype_directory_entry.setText(directory)
             self.config['last_used_directory'] = directory
-            self.save_config()
+            self.save_config_timer.start()
 
     def organize(self):
         if self.mode_combo.currentText() == 'Regex Sorting':
@@ -528,188 +967,88 @@ class TNIVOrganizer(QWidget):
             self.organize_by_filetype()
 
     def organize_regex(self):
-        if self.organizer is not None and self.organizer.isRunning():
-            self.organizer.terminate()
-            self.organizer.wait()
-
         try:
-            self.organizer = FileOrganizer(
+            self.start_organizer(FileOrganizer(
                 self.directory_entry.text(),
                 self.regex_entry.text(),
                 self.dry_run_check.isChecked(),
                 reverse=self.reverse_check.isChecked(),
                 organize_inside_folders=self.organize_inside_folders_check.isChecked(),
-                enable_backup=self.backup_option_check.isChecked()
-            )
-            self.organizer.progress_signal.connect(self.update_progress)
-            self.organizer.log_signal.connect(self.log_text.append)
-            self.organizer.start()
+                enable_backup=self.backup_option_check.isChecked(),
+                include_hidden=self.include_hidden_check.isChecked()
+            ))
         except Exception as e:
-            self.log_text.append(f'Error starting organizer: {e}')
+            self.log_text.appendPlainText(f'Error starting organizer: {e}')
             self.log_to_file(f'Error starting organizer: {e}')
 
-    def move_file(self, source_path: str, destination_folder: str, file: str, backup_dir: str = None):
-        destination_path = os.path.join(destination_folder, file)
-        if backup_dir:
-            backup_path = os.path.join(backup_dir, os.path.relpath(source_path, self.directory_entry.text()))
-            os.makedirs(os.path.dirname(backup_path), exist_ok=True)
-            shutil.copy2(source_path, backup_path)
-            self.log_text.append(f'Backup created for {file}')
-        if not self.dry_run_check.isChecked():
-            shutil.move(source_path, destination_path)
-        self.log_text.append(f'Moved {file} to {os.path.basename(destination_folder)}')
-        log_entry = {'action': 'move', 'source': source_path, 'destination': destination_path, 'timestamp': str(datetime.datetime.now()), 'sequence': self.organizer.action_counter}
-        self.logger.info(json.dumps(log_entry))
+    def start_organizer(self, organizer: 'FileOrganizer'):
+        if self.organizer is not None and self.organizer.isRunning():
+            # Wait for the old run to finish: replacing a running QThread destroys it, and two runs would share the tree and log
+            self.organizer.stop()
+            self.organizer.wait()
+        self.organizer = organizer
+        self.organizer.progress_signal.connect(self.update_progress)
+        self.organizer.log_signal.connect(self.queue_log)
+        self.organizer.start()
 
     def organize_by_filetype(self):
         directory = self.filetype_directory_entry.text()
         if not directory:
-            self.log_text.append('No directory selected.')
+            self.log_text.appendPlainText('No directory selected.')
             return
 
-        file_mappings = {
-            'Images': ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'tiff', 'tif', 'ico', 'webp', 'raw', 'cr2', 'nef', 'arw', 'dng', 'heic', 'psd', 'ai', 'eps'],
-            'Videos': ['mp4', 'mkv', 'flv', 'avi', 'mov', 'wmv', 'mpg', 'mpeg', 'm4v', 'h264', 'webm', '3gp', 'ogv', 'vob', 'ts', 'm2ts', 'mts'],
-            'Documents': ['doc', 'docx', 'pdf', 'txt', 'rtf', 'odt', 'xls', 'xlsx', 'ods', 'ppt', 'pptx', 'odp', 'csv', 'tsv', 'md', 'tex', 'log', 'json', 'xml', 'yml', 'yaml'],
-            'Audio': ['mp3', 'wav', 'aac', 'flac', 'ogg', 'wma', 'm4a', 'aiff', 'alac', 'ape', 'opus', 'mid', 'midi'],
-            'Archives': ['zip', 'rar', '7z', 'gz', 'tar', 'bz2', 'xz', 'tar.gz', 'tgz', 'tar.bz2', 'tar.xz', 'iso'],
-            'Code': ['py', 'js', 'html', 'css', 'java', 'cpp', 'c', 'h', 'hpp', 'cs', 'sh', 'bat', 'ps1', 'php', 'sql', 'rb', 'swift', 'go', 'rs', 'ts', 'jsx', 'vue', 'kt', 'scala', 'pl', 'lua', 'r'],
-            'eBooks': ['epub', 'mobi', 'azw', 'azw3', 'prc', 'pdf', 'djvu', 'fb2', 'lit', 'lrf'],
-            'Executables': ['exe', 'msi', 'app', 'dmg', 'deb', 'rpm', 'apk', 'ipa'],
-            'Fonts': ['ttf', 'otf', 'woff', 'woff2', 'eot'],
-            'Databases': ['db', 'sqlite', 'sqlite3', 'mdb', 'accdb'],
-            '3D_Models': ['obj', 'fbx', 'stl', 'blend', 'dae', '3ds', 'max'],
-            'CAD': ['dwg', 'dxf', 'step', 'stp', 'iges', 'igs'],
-            'Spreadsheets': ['xls', 'xlsx', 'ods', 'csv', 'tsv'],
-            'Presentations': ['ppt', 'pptx', 'odp', 'key'],
-            'Vector_Graphics': ['svg', 'ai', 'eps', 'cdr'],
-            'Disk_Images': ['iso', 'img', 'vhd', 'vmdk'],
-            'Config_Files': ['ini', 'cfg', 'conf', 'config'],
-            'Backup_Files': ['bak', 'old', 'backup'],
-            'Others': []
-        }
-
-        task = OrganizeByFiletypeTask(self, directory, file_mappings)
-        self.threadpool.start(task)
+        try:
+            self.start_organizer(FileOrganizer(
+                directory,
+                '',
+                self.dry_run_check.isChecked(),
+                organize_inside_folders=self.organize_inside_folders_check.isChecked(),
+                enable_backup=self.filetype_backup_option_check.isChecked(),
+                mode='filetype',
+                include_hidden=self.filetype_include_hidden_check.isChecked()
+            ))
+        except Exception as e:
+            self.log_text.appendPlainText(f'Error starting organizer: {e}')
+            self.log_to_file(f'Error starting organizer: {e}')
 
     def update_progress(self, value: int):
+        if value < 0:
+            self.progress.setRange(0, 0)
+            self.progress_label.setText('Scanning...')
+            return
+        self.progress.setRange(0, 100)
         self.progress.setValue(value)
         self.progress_label.setText(f'{value}% Completed')
 
+    def queue_log(self, message: str):
+        # Messages arriving within one flush interval reach the widget as a single append
+        self.pending_log.append(message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def flush_log(self):
+        if self.pending_log:
+            self.log_text.appendPlainText('\n'.join(self.pending_log))
+            self.pending_log.clear()
+
     def log_to_file(self, message: str):
-        with open('organizer.log', 'a') as f:
-            f.write(f'{message}\n')
+        ORGANIZER_LOGGER.info(message)
 
     def clear_log(self):
-        reply = QMessageBox.question(self, 'Clear Log', 'Are you sure you want to clear the log?',
-                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            open('tnivo.log', 'w').close()
-            open('TNIVO_error.log', 'w').close()
+        # Built on first use and reused for every later confirmation
+        if self.clear_log_confirm is None:
+            self.clear_log_confirm = QMessageBox(QMessageBox.Question, 'Clear Log', 'Are you sure you want to clear the log?',
+                                                 QMessageBox.Yes | QMessageBox.No, self)
+            self.clear_log_confirm.setDefaultButton(QMessageBox.No)
+        if self.clear_log_confirm.exec_() == QMessageBox.Yes:
+            for path in ('tnivo.log', 'TNIVO_error.log'):
+                try:
+                    os.truncate(path, 0)
+                except FileNotFoundError:
+                    pass
+            self.pending_log.clear()
             self.log_text.clear()
 
-    def dark_theme(self) -> str:
-        return """
-            QWidget {
-                background-color: #333;
-                color: #EEE;
-            }
-            QPushButton, QCheckBox, QComboBox, QLineEdit, QProgressBar, QTextEdit {
-                border: 1px solid #555;
-                padding: 5px;
-                margin: 5px;
-                border-radius: 5px;
-            }
-            QPushButton {
-                background-color: #555;
-                color: #EEE;
-            }
-            QPushButton:hover {
-                background-color: #777;
-            }
-            QProgressBar {
-                border: 2px solid #555;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #777;
-                width: 20px;
-            }
-            QTextEdit {
-                background-color: #222;
-                color: #EEE;
-            }
-        """
-
-    def green_theme(self) -> str:
-        return """
-            QWidget {
-                background-color: #E8F5E9;
-                color: #256029;
-            }
-            QPushButton, QCheckBox, QComboBox, QLineEdit, QProgressBar, QTextEdit {
-                border: 1px solid #A5D6A7;
-                padding: 5px;
-                margin: 5px;
-                border-radius: 5px;
-            }
-            QPushButton {
-                background-color: #A5D6A7;
-                color: #256029;
-            }
-            QPushButton:hover {
-                background-color: #81C784;
-            }
-            QProgressBar {
-                border: 2px solid #A5D6A7;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #81C784;
-                width: 20px;
-            }
-            QTextEdit {
-                background-color: #C8E6C9;
-                color: #256029;
-            }
-        """
-    
-    def white_theme(self) -> str:
-        return """
-            QWidget {
-                background-color: #FFF;
-                color: #000;
-            }
-            QPushButton, QCheckBox, QComboBox, QLineEdit, QProgressBar, QTextEdit {
-                border: 1px solid #CCC;
-                padding: 5px;
-                margin: 5px;
-                border-radius: 5px;
-            }
-            QPushButton {
-                background-color: #EEE;
-                color: #000;
-            }
-            QPushButton:hover {
-                background-color: #DDD;
-            }
-            QProgressBar {
-                border: 2px solid #CCC;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #DDD;
-                width: 20px;
-            }
-            QTextEdit {
-                background-color: #EEE;
-                color: #000;
-            }
-        """
-
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     ex = TNIVOrganizer()